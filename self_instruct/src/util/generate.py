@@ -1,4 +1,6 @@
 from typing import List
+
+import torch
 from transformers import AutoModel, AutoTokenizer, GenerationConfig
 
 
@@ -21,10 +23,11 @@ def generate(
         padding=True
     )
     data = {k: v.to(model.device) for k, v in data.items()}
-    output_ids = model.generate(
-        **data,
-        generation_config=generation_config
-    )
+    with torch.inference_mode():
+        output_ids = model.generate(
+            **data,
+            generation_config=generation_config
+        )
     outputs = []
     for sample_output_ids, sample_input_ids in zip(output_ids, data["input_ids"]):
         sample_output_ids = sample_output_ids[len(sample_input_ids):]
@@ -3,8 +3,7 @@ import sys
 
 import torch
 
-from transformers import AutoTokenizer, GenerationConfig, AutoModelForCausalLM, AutoConfig, BitsAndBytesConfig
-from peft import PeftConfig, PeftModel
+from transformers import AutoTokenizer, GenerationConfig, AutoModelForCausalLM, AutoConfig
 
 
 def load_saiga(
@@ -51,6 +50,8 @@ def load_saiga(
         model.eval()
         return model, tokenizer, generation_config
 
+    from peft import PeftConfig, PeftModel
+
     config = PeftConfig.from_pretrained(model_name)
     base_model_config = AutoConfig.from_pretrained(config.base_model_name_or_path)
 
@@ -61,6 +62,7 @@ def load_saiga(
 
     if device == "cuda":
         if use_4bit:
+            from transformers import BitsAndBytesConfig
             model = AutoModelForCausalLM.from_pretrained(
                 config.base_model_name_or_path,
                 torch_dtype=torch_dtype,
@@ -103,5 +105,5 @@ def load_saiga(
 
     model.eval()
     if torch_compile and torch.__version__ >= "2" and sys.platform != "win32":
-        model = torch.compile(model)
+        model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
     return model, tokenizer, generation_config